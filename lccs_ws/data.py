@@ -8,21 +8,65 @@
 """Data module of Land Cover Classification System Web Service."""
 import json
 import os
+from copy import deepcopy
+from functools import lru_cache, partial, wraps
+from threading import RLock
 
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from flask import abort
 from lccs_db.models import (ClassMapping, LucClass, LucClassificationSystem,
                             StyleFormats, Styles, db)
 from lccs_db.utils import get_mimetype
-from sqlalchemy import and_, distinct
+from sqlalchemy import and_, exists, update
+from sqlalchemy.orm import aliased, load_only
 
-from .forms import (ClassesMappingSchema, ClassesSchema,
-                    ClassificationSystemSchema, StyleFormatsSchema)
+from .config import Config
+from .forms import (classes_mapping_schema, classes_schema,
+                    classification_system_schema, style_formats_schema)
 
+YIELD_PER = 500
 
+_style_formats_cache = TTLCache(maxsize=256, ttl=Config.LCCS_CATALOG_CACHE_TTL)
+
+_style_formats_lock = RLock()
+
+_catalog_cache = TTLCache(maxsize=64, ttl=Config.LCCS_CATALOG_CACHE_TTL)
+
+_catalog_lock = RLock()
+
+
+def _catalog_cached(func):
+    """Cache the serialized result of a catalog getter for a short period.
+
+    Callers receive a copy of the cached value, so they are free to change it.
+    Caching is disabled when ``LCCS_CATALOG_CACHE_TTL`` is 0.
+    """
+    if not Config.LCCS_CATALOG_CACHE_TTL:
+        return func
+    
+    cached_func = cached(_catalog_cache, key=partial(hashkey, func.__name__), lock=_catalog_lock)(func)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return deepcopy(cached_func(*args, **kwargs))
+    
+    return wrapper
+
+
+def _invalidate_catalog():
+    """Clear the cached classification systems and style formats."""
+    _clear_style_formats_cache()
+    
+    with _catalog_lock:
+        _catalog_cache.clear()
+
+
+@_catalog_cached
 def get_classification_systems():
     """Retrieve all classification systems available in service."""
     system = db.session.query(LucClassificationSystem).all()
-    return ClassificationSystemSchema().dump(system, many=True)
+    return classification_system_schema.dump(system, many=True)
 
 
 def get_classification_system(system_id):
@@ -33,24 +77,23 @@ def get_classification_system(system_id):
     """
     system = db.session.query(LucClassificationSystem) \
         .filter(LucClassificationSystem.id == system_id).first_or_404()
-    return ClassificationSystemSchema().dump(system)
+    return classification_system_schema.dump(system)
 
 
 def get_classification_system_classes(system_id):
-    """Retrieve a list of classes for a given classification system.
+    """Retrieve the identifiers of the classes for a given classification system.
 
     :param system_id: identifier of a classification system
     :type system_id: int
     """
-    system = db.session.query(LucClassificationSystem) \
+    system = db.session.query(LucClassificationSystem.id) \
         .filter(LucClassificationSystem.id == system_id).first_or_404()
     
-    classes = db.session.query(LucClass) \
-        .join(LucClassificationSystem, LucClass.class_system_id == LucClassificationSystem.id) \
-        .filter(LucClassificationSystem.id == system_id) \
+    classes = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system.id) \
         .all()
     
-    return ClassesSchema().dump(classes, many=True)
+    return [row[0] for row in classes]
 
 
 def get_classification_system_class(system_id, class_id):
@@ -64,23 +107,23 @@ def get_classification_system_class(system_id, class_id):
     columns = [LucClass.id, LucClass.name, LucClass.code, LucClass.description, LucClass.class_parent_id]
     
     where = [
-        LucClassificationSystem.id == system_id,
-        (LucClass.id == class_id)
+        LucClass.class_system_id == system_id,
+        LucClass.id == class_id
     ]
     
     class_info = db.session.query(*columns) \
-        .join(LucClassificationSystem, LucClass.class_system_id == LucClassificationSystem.id) \
         .filter(*where) \
         .first_or_404()
     
-    return ClassesSchema().dump(class_info)
+    return classes_schema.dump(class_info)
 
 
+@_catalog_cached
 def get_style_formats():
     """Retrieve all styles formats available in service."""
-    style_formats = db.session.query(StyleFormats.id).all()
+    style_formats = db.session.query(StyleFormats.id, StyleFormats.name).all()
     
-    return StyleFormatsSchema().dump(style_formats, many=True)
+    return style_formats_schema.dump(style_formats, many=True)
 
 
 def get_style_format(style_format_id):
@@ -92,7 +135,7 @@ def get_style_format(style_format_id):
     style_format = db.session.query(StyleFormats). \
         filter(StyleFormats.id == style_format_id).first()
     
-    return StyleFormatsSchema().dump(style_format)
+    return style_formats_schema.dump(style_format)
 
 
 def get_system_style_format(system_id):
@@ -104,8 +147,9 @@ def get_system_style_format(system_id):
     if system_id:
         style_formats_id = db.session.query(Styles.style_format_id) \
             .filter(Styles.class_system_id == system_id) \
+            .distinct() \
             .all()
-        return style_formats_id
+        return [row[0] for row in style_formats_id]
 
 
 def get_classification_system_style(system_id, style_format_id):
@@ -123,11 +167,10 @@ def get_classification_system_style(system_id, style_format_id):
     
     where = [
         Styles.class_system_id == system_id,
-        and_(Styles.style_format_id == style_format_id),
+        Styles.style_format_id == style_format_id,
     ]
     
     style_file = db.session.query(*columns) \
-        .join(StyleFormats, StyleFormats.id == Styles.style_format_id) \
         .filter(*where) \
         .first()
     
@@ -140,64 +183,57 @@ def get_mappings(system_id_source):
     :param system_id_source: identification of a source classification system
     :type system_id_source: int
     """
-    classes_source = db.session.query(LucClass.id) \
-        .filter(LucClass.class_system_id == system_id_source) \
-        .all()
-    
-    targets_class_id = db.session.query(distinct(ClassMapping.target_class_id)) \
-        .filter(ClassMapping.source_class_id.in_(classes_source)) \
-        .all()
-    
-    systems = db.session.query(distinct(LucClassificationSystem.id)) \
-        .join(LucClass, LucClass.class_system_id == LucClassificationSystem.id) \
-        .filter(LucClass.id.in_(targets_class_id)) \
+    source_class = aliased(LucClass)
+    target_class = aliased(LucClass)
+    
+    systems = db.session.query(target_class.class_system_id) \
+        .select_from(ClassMapping) \
+        .join(source_class, ClassMapping.source_class_id == source_class.id) \
+        .join(target_class, ClassMapping.target_class_id == target_class.id) \
+        .filter(source_class.class_system_id == system_id_source) \
+        .group_by(target_class.class_system_id) \
         .all()
     
     return [value[0] for value in systems]
 
 
-def get_system_mapping(system_id_source, system_id_target):
-    """Return a Mapping.
+def _system_mapping_query(system_id_source, system_id_target):
+    """Build the query of mappings between two classification systems."""
+    source_class = aliased(LucClass)
+    target_class = aliased(LucClass)
+    
+    return db.session.query(ClassMapping) \
+        .join(source_class, ClassMapping.source_class_id == source_class.id) \
+        .join(target_class, ClassMapping.target_class_id == target_class.id) \
+        .filter(source_class.class_system_id == system_id_source,
+                target_class.class_system_id == system_id_target)
 
-    :param system_id_source: identification of a source classification system
+
+def get_mapping(system_id_source, system_id_target):
+    """Return classes mapping.
+    
+    :param system_id_source: identifier of a source classification system
     :type system_id_source: int
-    :param system_id_target: identification of a target classification system
+    :param system_id_target: identifier of a target classification system
     :type system_id_target: int
     """
-    classes_source = db.session.query(LucClass.id) \
-        .filter(LucClass.class_system_id == system_id_source) \
-        .all()
-    
-    classes_target = db.session.query(LucClass.id) \
-        .filter(LucClass.class_system_id == system_id_target) \
-        .all()
-    
-    columns = [
-        ClassMapping.target_class_id,
-        ClassMapping.source_class_id,
-        ClassMapping.description,
-        ClassMapping.degree_of_similarity
-    ]
+    mappings = _system_mapping_query(system_id_source, system_id_target).all()
     
-    mappings = db.session.query(ClassMapping) \
-        .filter(
-        and_(ClassMapping.source_class_id.in_(classes_source), ClassMapping.target_class_id.in_(classes_target))) \
-        .all()
-    
-    return mappings
+    return classes_mapping_schema.dump(mappings, many=True)
 
 
-def get_mapping(system_id_source, system_id_target):
-    """Return classes mapping.
+def iter_mapping(system_id_source, system_id_target):
+    """Iterate over classes mapping, serializing one mapping at a time.
     
     :param system_id_source: identifier of a source classification system
-    :type system_id_source: integer
-    :param system_id_target: identifier of a targer classification system
-    :type system_id_target: integer
+    :type system_id_source: int
+    :param system_id_target: identifier of a target classification system
+    :type system_id_target: int
     """
-    mappings = get_system_mapping(system_id_source, system_id_target)
+    mappings = _system_mapping_query(system_id_source, system_id_target).yield_per(YIELD_PER)
     
-    return ClassesMappingSchema().dump(mappings, many=True)
+    for mapping in mappings:
+        yield classes_mapping_schema.dump(mapping)
 
 
 def classification_system(system_id):
@@ -209,6 +245,35 @@ def classification_system(system_id):
     return LucClassificationSystem.query.filter_by(id=system_id).first_or_404()
 
 
+def _update_returning(model, where, values: dict, commit=True):
+    """Update a row with a single UPDATE ... RETURNING statement.
+
+    :param model: model class to be updated
+    :param where: list of conditions which identifies the row
+    :type where: list
+    :param values: columns and values to update
+    :type values: dict
+    :param commit: commit the transaction after the update
+    :type commit: bool
+    """
+    table = model.__table__
+    
+    if not values:
+        return db.session.query(*table.columns).filter(*where).first_or_404()
+    
+    row = db.session.execute(
+        update(table).where(and_(*where)).values(**values).returning(*table.columns)
+    ).first()
+    
+    if row is None:
+        abort(404)
+    
+    if commit:
+        db.session.commit()
+    
+    return row
+
+
 def create_classification_system(name, authority_name, version, description=None):
     """Create a full classification system.
 
@@ -221,9 +286,11 @@ def create_classification_system(name, authority_name, version, description=None
     :param description: Classification system description
     :type description: string
     """
-    system = db.session.query(LucClassificationSystem).filter(LucClassificationSystem.name == name,
-                                                              LucClassificationSystem.version == version).first()
-    if system:
+    system_exists = db.session.query(
+        exists().where(and_(LucClassificationSystem.name == name, LucClassificationSystem.version == version))
+    ).scalar()
+    
+    if system_exists:
         abort(400, 'Classification System already registered!')
     
     classification_system_info = dict(name=name, authority_name=authority_name, version=version,
@@ -236,6 +303,8 @@ def create_classification_system(name, authority_name, version, description=None
     
     db.session.commit()
     
+    _invalidate_catalog()
+    
     return system
 
 
@@ -245,11 +314,15 @@ def delete_classification_system(system_id):
     :param system_id: identifier of a classification system to be deleted
     :type system_id: string
     """
-    system = db.session.query(LucClassificationSystem).filter(LucClassificationSystem.id == system_id).first_or_404()
+    system = db.session.query(LucClassificationSystem) \
+        .options(load_only(LucClassificationSystem.id)) \
+        .filter(LucClassificationSystem.id == system_id).first_or_404()
     
     db.session.delete(system)
     
     db.session.commit()
+    
+    _invalidate_catalog()
 
 
 def update_classification_system(system_id, obj: dict):
@@ -260,31 +333,27 @@ def update_classification_system(system_id, obj: dict):
     :param obj: Object with classification system information to update
     :type obj: dict
     """
-    system = classification_system(system_id)
+    system = _update_returning(LucClassificationSystem, [LucClassificationSystem.id == system_id], obj)
     
-    with db.session.begin_nested():
-        for attr in obj.keys():
-            setattr(system, attr, obj.get(attr))
-    
-    db.session.commit()
+    _invalidate_catalog()
     
     return system
 
 
 def delete_classes(class_system):
     """Delete all class by a given classification system."""
-    classes = LucClass.filter(class_system_id=class_system.id)
-    
     with db.session.begin_nested():
-        for c in classes:
-            db.session.delete(c)
+        db.session.query(LucClass) \
+            .filter(LucClass.class_system_id == class_system.id) \
+            .delete(synchronize_session=False)
     db.session.commit()
 
 
 def delete_class(system_id: int, class_id: int):
     """Delete an class by a given name and classification system."""
-    class_to_delete = db.session.query(LucClass).filter(LucClass.id == class_id,
-                                                        LucClass.class_system_id == system_id).first_or_404()
+    class_to_delete = db.session.query(LucClass) \
+        .options(load_only(LucClass.id)) \
+        .filter(LucClass.id == class_id, LucClass.class_system_id == system_id).first_or_404()
     
     with db.session.begin_nested():
         db.session.delete(class_to_delete)
@@ -294,47 +363,12 @@ def delete_class(system_id: int, class_id: int):
 
 def update_class(system_id: int, class_id: int, obj: dict):
     """Update an classification system by a given name."""
-    system_class = LucClass.query.filter_by(id=class_id, class_system_id=system_id).first_or_404()
-    
-    with db.session.begin_nested():
-        for attr in obj.keys():
-            setattr(system_class, attr, obj.get(attr))
-    
-    db.session.commit()
-    
-    return system_class
-
-
-def insert_class(system_id: int, name, code, description, class_parent_id=None):
-    """Create a new class.
-
-    :param system_id: identifier of classification system.
-    :type system_id: int
-    :param name: name of a class.
-    :type name: string
-    :param code: class code.
-    :type code: string
-    :param description: class description.
-    :type description: string
-    :param class_parent_id: class class_parent_id.
-    :type class_parent_id: integer
-    """
-    system_class = db.session.query(LucClass).filter_by(class_system_id=system_id, name=name).first()
-    
-    if system_class:
-        abort(409, 'Class already registered in the system!')
-    
-    class_infos = dict(
-        name=name,
-        code=code,
-        description=description,
-        class_system_id=system_id,
-        class_parent_id=class_parent_id
-    )
-    
-    system_class = LucClass(**dict(class_infos))
+    where = [
+        LucClass.id == class_id,
+        LucClass.class_system_id == system_id
+    ]
     
-    db.session.add(system_class)
+    return _update_returning(LucClass, where, obj)
 
 
 def insert_classes(system_id: str, classes_files_json: dict):
@@ -345,14 +379,28 @@ def insert_classes(system_id: str, classes_files_json: dict):
     :param system_id: classification system identifier
     :type system_id: string
     """
-    system = classification_system(system_id)
+    db.session.query(LucClassificationSystem.id).filter_by(id=system_id).first_or_404()
+    
+    registered = {row[0] for row in db.session.query(LucClass.name).filter_by(class_system_id=system_id).all()}
     
-    if system is None:
-        abort(400, f'Error to add new class Classification System {system_id} not exist')
+    classes_infos = list()
+    
+    for classes in classes_files_json:
+        if classes['name'] in registered:
+            abort(409, 'Class already registered in the system!')
+        
+        registered.add(classes['name'])
+        
+        classes_infos.append(dict(
+            name=classes['name'],
+            code=classes['code'],
+            description=classes['description'],
+            class_system_id=system_id,
+            class_parent_id=classes.get('class_parent_id')
+        ))
     
     with db.session.begin_nested():
-        for classes in classes_files_json:
-            insert_class(system_id, **classes)
+        db.session.bulk_insert_mappings(LucClass, classes_infos)
     db.session.commit()
     
     classes = db.session.query(LucClass).filter(LucClass.class_system_id == system_id).all()
@@ -360,6 +408,46 @@ def insert_classes(system_id: str, classes_files_json: dict):
     return classes
 
 
+@lru_cache(maxsize=256)
+def _mimetype_for(extension):
+    """Return the mime type for a given file extension."""
+    return get_mimetype(f'style{extension}')
+
+
+def _file_mimetype(file_name):
+    """Return the mime type of an uploaded style file."""
+    return _mimetype_for(os.path.splitext(file_name)[1].lower())
+
+
+def _style_format_exists(style_format_id):
+    """Verify if style format exist in server, caching known identifiers.
+
+    :param style_format_id: identifier of a style format
+    :type style_format_id: int
+    """
+    key = int(style_format_id)
+    
+    with _style_formats_lock:
+        if key in _style_formats_cache:
+            return
+    
+    db.session.query(StyleFormats.id) \
+        .filter(StyleFormats.id == style_format_id) \
+        .first_or_404()
+    
+    if not Config.LCCS_CATALOG_CACHE_TTL:
+        return
+    
+    with _style_formats_lock:
+        _style_formats_cache[key] = True
+
+
+def _clear_style_formats_cache():
+    """Forget the known style format identifiers."""
+    with _style_formats_lock:
+        _style_formats_cache.clear()
+
+
 def insert_file(style_format_id, system_id, file):
     """Insert File method.
 
@@ -370,15 +458,13 @@ def insert_file(style_format_id, system_id, file):
     :param file: Style File.
     :type file: binary
     """
-    system = classification_system(system_id)
+    db.session.query(LucClassificationSystem.id).filter_by(id=system_id).first_or_404()
     
-    style_format = db.session.query(StyleFormats) \
-        .filter(StyleFormats.id == style_format_id) \
-        .first_or_404()
+    _style_format_exists(style_format_id)
     
     style_file = file.read()
     
-    mime_type = get_mimetype(file.filename)
+    mime_type = _file_mimetype(file.filename)
     
     style = Styles(class_system_id=system_id,
                    style_format_id=style_format_id,
@@ -408,7 +494,7 @@ def update_file(style_format_id, system_id, file):
     
     style_file = file.read()
     
-    mime_type = get_mimetype(file.filename)
+    mime_type = _file_mimetype(file.filename)
     
     with db.session.begin_nested():
         style.style = style_file
@@ -429,29 +515,6 @@ def delete_file(style_format_id, system_id):
     db.session.commit()
 
 
-def insert_mapping(system_id_source, system_id_target, target_class_id, source_class_id, description,
-                   degree_of_similarity):
-    """Insert mapping."""
-    source_class = db.session.query(LucClass). \
-        filter_by(id=source_class_id, class_system_id=system_id_source) \
-        .first_or_404()
-    
-    target_class = db.session.query(LucClass) \
-        .filter_by(id=target_class_id, class_system_id=system_id_target) \
-        .first_or_404()
-    
-    mapping_infos = dict(
-        source_class_id=source_class_id,
-        target_class_id=target_class_id,
-        description=description,
-        degree_of_similarity=degree_of_similarity
-    )
-    
-    mapping = ClassMapping(**dict(mapping_infos))
-    
-    db.session.add(mapping)
-
-
 def insert_mappings(system_id_source, system_id_target, mapping_file: dict):
     """Create classes for a given classification system.
 
@@ -462,10 +525,39 @@ def insert_mappings(system_id_source, system_id_target, mapping_file: dict):
     :param mapping_file: json file with mappings
     :type mapping_file: json
     """
-    for mapping in mapping_file:
-        with db.session.begin_nested():
-            insert_mapping(system_id_source, system_id_target, **mapping)
-        db.session.commit()
+    if not mapping_file:
+        return get_mapping(system_id_source, system_id_target)
+    
+    source_classes_id = {int(mapping['source_class_id']) for mapping in mapping_file}
+    target_classes_id = {int(mapping['target_class_id']) for mapping in mapping_file}
+    
+    source_classes = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_source, LucClass.id.in_(source_classes_id)) \
+        .all()
+    
+    target_classes = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_target, LucClass.id.in_(target_classes_id)) \
+        .all()
+    
+    if source_classes_id - {row[0] for row in source_classes}:
+        abort(404, 'Source class not found in the classification system!')
+    
+    if target_classes_id - {row[0] for row in target_classes}:
+        abort(404, 'Target class not found in the classification system!')
+    
+    mappings_infos = [
+        dict(
+            source_class_id=int(mapping['source_class_id']),
+            target_class_id=int(mapping['target_class_id']),
+            description=mapping.get('description'),
+            degree_of_similarity=mapping.get('degree_of_similarity')
+        )
+        for mapping in mapping_file
+    ]
+    
+    with db.session.begin_nested():
+        db.session.bulk_insert_mappings(ClassMapping, mappings_infos)
+    db.session.commit()
     
     mappings = get_mapping(system_id_source, system_id_target)
     
@@ -473,7 +565,7 @@ def insert_mappings(system_id_source, system_id_target, mapping_file: dict):
 
 
 def update_mapping(system_id_source, system_id_target, target_class_id, source_class_id, description=None,
-                   degree_of_similarity=None):
+                   degree_of_similarity=None, commit=True):
     """Update a exist mapping.
     
     :param system_id_source: identifier of a source classification system
@@ -488,26 +580,30 @@ def update_mapping(system_id_source, system_id_target, target_class_id, source_c
     :type description: string
     :param degree_of_similarity: the degree_of_similarity of a mapping
     :type degree_of_similarity: float
+    :param commit: commit the transaction after the update
+    :type commit: bool
     """
-    source_class = db.session.query(LucClass) \
-        .filter_by(id=source_class_id, class_system_id=system_id_source) \
-        .first_or_404()
+    classes_source = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_source)
     
-    target_class = db.session.query(LucClass) \
-        .filter_by(id=target_class_id, class_system_id=system_id_target) \
-        .first_or_404()
+    classes_target = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_target)
     
-    mapping = db.session.query(ClassMapping) \
-        .filter(ClassMapping.source_class_id == source_class_id, ClassMapping.target_class_id == target_class_id) \
-        .first_or_404()
+    where = [
+        ClassMapping.source_class_id == source_class_id,
+        ClassMapping.target_class_id == target_class_id,
+        ClassMapping.source_class_id.in_(classes_source),
+        ClassMapping.target_class_id.in_(classes_target)
+    ]
     
-    with db.session.begin_nested():
-        if description:
-            mapping.description = description
-        if degree_of_similarity:
-            mapping.degree_of_similarity = degree_of_similarity
+    values = dict()
     
-    db.session.commit()
+    if description:
+        values['description'] = description
+    if degree_of_similarity:
+        values['degree_of_similarity'] = degree_of_similarity
+    
+    _update_returning(ClassMapping, where, values, commit=commit)
 
 
 def update_mappings(system_id_source, system_id_target, mappings):
@@ -520,8 +616,11 @@ def update_mappings(system_id_source, system_id_target, mappings):
     :param mappings: mappings to update
     :type mappings: json
     """
-    for mapping in mappings:
-        update_mapping(system_id_source, system_id_target, **mapping)
+    with db.session.begin_nested():
+        for mapping in mappings:
+            update_mapping(system_id_source, system_id_target, commit=False, **mapping)
+    
+    db.session.commit()
     
     mappings = get_mapping(system_id_source, system_id_target)
     
@@ -530,14 +629,17 @@ def update_mappings(system_id_source, system_id_target, mappings):
 
 def delete_mappings(system_id_source, system_id_target):
     """Delete classification system mappings."""
-    mappings = get_system_mapping(system_id_source, system_id_target)
+    classes_source = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_source)
     
-    if mappings is None:
-        abort(400, f'Error to delete mapping')
+    classes_target = db.session.query(LucClass.id) \
+        .filter(LucClass.class_system_id == system_id_target)
     
     with db.session.begin_nested():
-        for m in mappings:
-            db.session.delete(m)
+        db.session.query(ClassMapping) \
+            .filter(ClassMapping.source_class_id.in_(classes_source),
+                    ClassMapping.target_class_id.in_(classes_target)) \
+            .delete(synchronize_session=False)
     
     db.session.commit()
     
@@ -550,11 +652,9 @@ def create_style_format(name: str):
     :param name: name for a new style format
     :type name: string
     """
-    style_format = db.session.query(StyleFormats). \
-        filter_by(name=name) \
-        .first()
+    style_format_exists = db.session.query(exists().where(StyleFormats.name == name)).scalar()
     
-    if style_format is not None:
+    if style_format_exists:
         abort(400, f'Error to add new class style format {name} already exist')
     
     with db.session.begin_nested():
@@ -564,6 +664,8 @@ def create_style_format(name: str):
     
     db.session.commit()
     
+    _invalidate_catalog()
+    
     return style_format
 
 
@@ -579,6 +681,8 @@ def delete_style_format(style_format_id):
     
     db.session.delete(style_format)
     db.session.commit()
+    
+    _invalidate_catalog()
 
 
 def update_style_format(style_format_id, name):
@@ -589,18 +693,14 @@ def update_style_format(style_format_id, name):
     :param name: name of style format for update.
     :type name: string
     """
-    style_format = db.session.query(StyleFormats) \
-        .filter_by(id=style_format_id) \
-        .first_or_404()
+    style_format = _update_returning(StyleFormats, [StyleFormats.id == style_format_id], dict(name=name))
     
-    with db.session.begin_nested():
-        style_format.name = name
-    
-    db.session.commit()
+    _invalidate_catalog()
     
     return style_format
 
 
+@_catalog_cached
 def get_identifier_system(system_name, system_version):
     """Return the identifier of classification system and classes.
     
@@ -613,9 +713,10 @@ def get_identifier_system(system_name, system_version):
         .filter(LucClassificationSystem.name == system_name, LucClassificationSystem.version == system_version) \
         .first_or_404()
     
-    return system
+    return classification_system_schema.dump(system)
 
 
+@_catalog_cached
 def get_identifier_style_format(style_format_name):
     """Return the identifier of style format.
     
@@ -626,4 +727,4 @@ def get_identifier_style_format(style_format_name):
         .filter_by(name=style_format_name)\
         .first_or_404()
     
-    return style
+    return style_formats_schema.dump(style)
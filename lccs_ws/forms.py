@@ -131,3 +131,13 @@ class StyleSchema(ModelSchema):
         
         model = Styles
         exclude = ('created_at', 'updated_at',)
+
+
+classification_system_schema = ClassificationSystemSchema()
+classification_system_metadata_schema = ClassificationSystemMetadataSchema()
+classes_schema = ClassesSchema()
+class_metadata_schema = ClassMetadataSchema()
+classes_mapping_schema = ClassesMappingSchema()
+classes_mapping_metadata_schema = ClassesMappingMetadataSchema()
+style_formats_schema = StyleFormatsSchema()
+style_formats_metadata_schema = StyleFormatsMetadataSchema()
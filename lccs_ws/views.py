@@ -9,13 +9,16 @@
 from io import BytesIO
 
 from bdc_auth_client.decorators import oauth2
-from flask import abort, current_app, jsonify, request, send_file
+from flask import (Response, abort, current_app, json, jsonify, request,
+                   send_file, stream_with_context)
 from lccs_db.utils import get_extension
 
-from lccs_ws.forms import (ClassesMappingMetadataSchema, ClassesMappingSchema,
-                           ClassesSchema, ClassificationSystemMetadataSchema,
-                           ClassificationSystemSchema, ClassMetadataSchema,
-                           StyleFormatsMetadataSchema, StyleFormatsSchema)
+from lccs_ws.forms import (class_metadata_schema,
+                           classes_mapping_metadata_schema,
+                           classes_mapping_schema, classes_schema,
+                           classification_system_metadata_schema,
+                           classification_system_schema,
+                           style_formats_metadata_schema, style_formats_schema)
 
 from . import data
 from .config import Config
@@ -141,7 +144,7 @@ def classification_systems_classes(system_id):
     
     :param system_id: identifier of a classification system
     """
-    classes_list = data.get_classification_system_classes(system_id)
+    classes_id = data.get_classification_system_classes(system_id)
 
     links = list()
     
@@ -172,13 +175,13 @@ def classification_systems_classes(system_id):
         },
     ]
 
-    if not len(classes_list) > 0:
+    if not len(classes_id) > 0:
         return jsonify(links)
     
-    for system_classes in classes_list:
+    for class_id in classes_id:
         links.append(
             {
-                "href": f"{BASE_URL}/classification_systems/{system_id}/classes/{system_classes['id']}",
+                "href": f"{BASE_URL}/classification_systems/{system_id}/classes/{class_id}",
                 "rel": "child",
                 "type": "application/json",
                 "title": "Classification System Classes",
@@ -271,6 +274,32 @@ def get_mappings(system_id):
     return jsonify(links)
 
 
+def _add_mapping_links(mp, system_id_source):
+    """Add the links of a serialized mapping.
+
+    :param mp: serialized mapping
+    :param system_id_source: identifier of source classification system
+    """
+    links = [
+        {
+            "href": f"{BASE_URL}/classification_systems/{system_id_source}/classes/{mp['source_class_id']}",
+            "rel": "item",
+            "type": "application/json",
+            "title": "Link to the source class",
+        },
+        {
+            "href": f"{BASE_URL}/classification_systems/{system_id_source}/classes/{mp['target_class_id']}",
+            "rel": "item",
+            "type": "application/json",
+            "title": "Link to target class",
+        },
+    ]
+    mp["degree_of_similarity"] = float(mp["degree_of_similarity"])
+    mp["links"] = links
+    
+    return mp
+
+
 @current_app.route("/mappings/<system_id_source>/<system_id_target>", methods=["GET"])
 def get_mapping(system_id_source, system_id_target):
     """Retrieve mapping.
@@ -278,27 +307,20 @@ def get_mapping(system_id_source, system_id_target):
     :param system_id_source: identifier of source classification system
     :param system_id_target: identifier of target classification system
     """
-    class_system_mappings = data.get_mapping(system_id_source, system_id_target)
+    class_system_mappings = data.iter_mapping(system_id_source, system_id_target)
     
-    for mp in class_system_mappings:
-        links = [
-            {
-                "href": f"{BASE_URL}/classification_systems/{system_id_source}/classes/{mp['source_class_id']}",
-                "rel": "item",
-                "type": "application/json",
-                "title": "Link to the source class",
-            },
-            {
-                "href": f"{BASE_URL}/classification_systems/{system_id_source}/classes/{mp['target_class_id']}",
-                "rel": "item",
-                "type": "application/json",
-                "title": "Link to target class",
-            },
-        ]
-        mp["degree_of_similarity"] = float(mp["degree_of_similarity"])
-        mp["links"] = links
+    def generate():
+        yield '['
+        
+        for index, mp in enumerate(class_system_mappings):
+            if index > 0:
+                yield ','
+            
+            yield json.dumps(_add_mapping_links(mp, system_id_source))
+        
+        yield ']'
     
-    return jsonify(class_system_mappings)
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @current_app.route("/style_formats", methods=["GET"])
@@ -418,7 +440,7 @@ def get_style_formats_classification_system(system_id):
     for style_id in style_formats_id:
         links.append(
             {
-                "href": f"{BASE_URL}/classification_systems/{system_id}/styles/{style_id[0]}",
+                "href": f"{BASE_URL}/classification_systems/{system_id}/styles/{style_id}",
                 "rel": "style",
                 "type": "application/json",
                 "title": "style_format",
@@ -460,7 +482,7 @@ def classification_system_search(system_name, system_version):
     """
     system = data.get_identifier_system(system_name, system_version)
     
-    return ClassificationSystemSchema().dump(system), 200
+    return system, 200
 
 
 @current_app.route("/style_formats/search/<style_format_name>", methods=["GET"])
@@ -471,7 +493,7 @@ def style_format_search(style_format_name):
     """
     style_format = data.get_identifier_style_format(style_format_name)
     
-    return StyleFormatsSchema().dump(style_format), 200
+    return style_format, 200
 
 
 @current_app.route('/classification_systems', defaults={'system_id': None}, methods=["POST"])
@@ -485,14 +507,14 @@ def edit_classification_system(system_id, **kwargs):
     if request.method == "POST":
         args = request.get_json()
         
-        errors = ClassificationSystemSchema().validate(args)
+        errors = classification_system_schema.validate(args)
         
         if errors:
             return abort(400, str(errors))
         
         classification_system = data.create_classification_system(**args)
         
-        return ClassificationSystemSchema().dump(classification_system), 201
+        return classification_system_schema.dump(classification_system), 201
     
     if request.method == "DELETE":
         data.delete_classification_system(system_id)
@@ -502,14 +524,14 @@ def edit_classification_system(system_id, **kwargs):
     if request.method == "PUT":
         args = request.get_json()
         
-        errors = ClassificationSystemMetadataSchema().validate(args)
+        errors = classification_system_metadata_schema.validate(args)
         
         if errors:
             return abort(400, str(errors))
         
         classification_system = data.update_classification_system(system_id, args)
         
-        return ClassificationSystemSchema().dump(classification_system), 200
+        return classification_system_schema.dump(classification_system), 200
 
 
 @current_app.route("/classification_systems/<system_id>/classes", methods=["POST"])
@@ -521,14 +543,14 @@ def create_class_system_classes(system_id, **kwargs):
     """
     args = request.get_json()
     
-    errors = ClassesSchema(many=True).validate(args)
+    errors = classes_schema.validate(args, many=True)
     
     if errors:
         return abort(400, str(errors))
     
     classes = data.insert_classes(system_id, args)
     
-    result = ClassesSchema().dump(classes, many=True)
+    result = classes_schema.dump(classes, many=True)
     
     return jsonify(result), 201
 
@@ -550,14 +572,14 @@ def edit_class_system_class(system_id, class_id, **kwargs):
         
         args = request.get_json()
         
-        errors = ClassMetadataSchema().validate(args)
+        errors = class_metadata_schema.validate(args)
         
         if errors:
             return abort(400, str(errors))
         
         system_class = data.update_class(system_id, class_id, args)
         
-        return ClassesSchema().dump(system_class), 200
+        return classes_schema.dump(system_class), 200
 
 
 @current_app.route("/mappings/<system_id_source>/<system_id_target>", methods=["POST", "PUT", "DELETE"])
@@ -571,14 +593,14 @@ def edit_mapping(system_id_source, system_id_target, **kwargs):
     if request.method == "POST":
         args = request.get_json()
         
-        errors = ClassesMappingSchema(many=True).validate(args)
+        errors = classes_mapping_schema.validate(args, many=True)
         
         if errors:
             return abort(400, str(errors))
         
         mappings = data.insert_mappings(system_id_source, system_id_target, args)
         
-        return jsonify(ClassesMappingSchema().dump(mappings, many=True)), 201
+        return jsonify(classes_mapping_schema.dump(mappings, many=True)), 201
     
     if request.method == "DELETE":
         data.delete_mappings(system_id_source, system_id_target)
@@ -588,14 +610,14 @@ def edit_mapping(system_id_source, system_id_target, **kwargs):
     if request.method == "PUT":
         args = request.get_json()
         
-        errors = ClassesMappingMetadataSchema(many=True).validate(args)
+        errors = classes_mapping_metadata_schema.validate(args, many=True)
         
         if errors:
             return abort(400, str(errors))
         
         mappings = data.update_mappings(system_id_source, system_id_target, args)
         
-        return jsonify(ClassesMappingSchema().dump(mappings, many=True)), 200
+        return jsonify(classes_mapping_schema.dump(mappings, many=True)), 200
 
 
 @current_app.route("/classification_systems/<system_id>/styles", defaults={'style_format_id': None}, methods=["POST"])
@@ -720,14 +742,14 @@ def edit_style_formats(style_format_id, **kwargs):
     if request.method == "POST":
         args = request.get_json()
         
-        errors = StyleFormatsSchema().validate(args)
+        errors = style_formats_schema.validate(args)
         
         if errors:
             return abort(400, str(errors))
         
         style_format = data.create_style_format(**args)
         
-        return jsonify(StyleFormatsSchema().dump(style_format)), 201
+        return jsonify(style_formats_schema.dump(style_format)), 201
     
     if request.method == "DELETE":
         data.delete_style_format(style_format_id)
@@ -737,11 +759,11 @@ def edit_style_formats(style_format_id, **kwargs):
     if request.method == "PUT":
         args = request.get_json()
         
-        errors = StyleFormatsMetadataSchema().validate(args)
+        errors = style_formats_metadata_schema.validate(args)
         
         if errors:
             return abort(400, str(errors))
         
         style_format = data.update_style_format(style_format_id, **args)
         
-        return jsonify(StyleFormatsSchema().dump(style_format)), 200
+        return jsonify(style_formats_schema.dump(style_format)), 200
@@ -45,6 +45,7 @@ setup_requires = [
 
 install_requires = [
     'Flask>=1.1.1',
+    'cachetools>=4.1',
     'marshmallow-sqlalchemy==0.18.0',
     'jsonschema>=3.2',
     'lccs-db @ git+git://github.com/brazil-data-cube/lccs-db',
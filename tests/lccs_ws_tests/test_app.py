@@ -116,6 +116,31 @@ class TestLCCSWS:
 
         self._assert_json(response, expected_code=404)
 
+    def test_mapping(self, client):
+        mappings = client.get('/mappings/1')
+
+        self._assert_json(mappings, expected_code=200)
+
+        target_id = [link['href'].split('/')[-1] for link in mappings.json if link['rel'] == 'child'][0]
+
+        response = client.get(f'/mappings/1/{target_id}')
+
+        self._assert_json(response, expected_code=200)
+        assert len(response.json) > 0
+
+        for mapping in response.json:
+            hrefs = [link['href'] for link in mapping['links']]
+
+            assert len(hrefs) == 2
+            assert hrefs[0].endswith(f"/classification_systems/1/classes/{mapping['source_class_id']}")
+            assert hrefs[1].endswith(f"/classes/{mapping['target_class_id']}")
+
+    def test_mapping_empty(self, client):
+        response = client.get('/mappings/1/10000')
+
+        self._assert_json(response, expected_code=200)
+        assert json.loads(response.get_data(as_text=True)) == []
+
     def test_classification_system_403(self, client):
         # Test Bad Request (Missing parameters)
         failed = client.post('/classification_systems', data=dict())
@@ -143,6 +168,62 @@ class TestLCCSWS:
         self._assert_json(response, expected_code=201)
         validate(instance=response.json, schema=classification_system_type)
 
+        systems = client.get('/classification_systems')
+
+        assert response.json['id'] in [system['id'] for system in systems.json]
+
+    def test_update_classification_system(self, client, mock_oauth2_cache):
+        headers = self._configure_authentication_test(mock_oauth2_cache, roles=['admin'])
+
+        systems = client.get('/classification_systems')
+
+        sys_id = max([system['id'] for system in systems.json])
+
+        response = client.put(f'/classification_systems/{sys_id}', json=dict(description='BDC Updated'),
+                              headers=headers)
+
+        self._assert_json(response, expected_code=200)
+        validate(instance=response.json, schema=classification_system_type)
+        assert response.json['id'] == sys_id
+        assert response.json['description'] == 'BDC Updated'
+
+        systems = client.get('/classification_systems')
+
+        assert 'BDC Updated' in [system['description'] for system in systems.json if system['id'] == sys_id]
+
+    def test_update_classification_system_404(self, client, mock_oauth2_cache):
+        headers = self._configure_authentication_test(mock_oauth2_cache, roles=['admin'])
+
+        response = client.put('/classification_systems/10000', json=dict(description='BDC Updated'),
+                              headers=headers)
+
+        self._assert_json(response, expected_code=404)
+
+    def test_update_class_404(self, client, mock_oauth2_cache):
+        headers = self._configure_authentication_test(mock_oauth2_cache, roles=['admin'])
+
+        response = client.put('/classification_systems/1/classes/10000', json=dict(description='Updated'),
+                              headers=headers)
+
+        self._assert_json(response, expected_code=404)
+
+    def test_update_mapping_class_outside_source(self, client, mock_oauth2_cache):
+        headers = self._configure_authentication_test(mock_oauth2_cache, roles=['admin'])
+
+        mappings = client.get('/mappings/1')
+
+        target_id = [link['href'].split('/')[-1] for link in mappings.json if link['rel'] == 'child'][0]
+
+        classes = client.get(f'/classification_systems/{target_id}/classes')
+
+        class_id = int([link['href'].split('/')[-1] for link in classes.json if link['rel'] == 'child'][0])
+
+        mapping = dict(source_class_id=class_id, target_class_id=class_id, description='Updated')
+
+        response = client.put(f'/mappings/1/{target_id}', json=[mapping], headers=headers)
+
+        self._assert_json(response, expected_code=404)
+
     def test_delete_classification_system(self, client, mock_oauth2_cache):
         headers = self._configure_authentication_test(mock_oauth2_cache, roles=['admin'])
 
@@ -153,3 +234,7 @@ class TestLCCSWS:
         response = client.delete(f'/classification_systems/{sys_id}', headers=headers)
 
         self._assert_json(response, expected_code=204)
+
+        systems = client.get('/classification_systems')
+
+        assert sys_id not in [system['id'] for system in systems.json]